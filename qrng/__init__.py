@@ -4,16 +4,18 @@ QRNG API Python SDK
 Official Python client for the QRNG API - Quantum Random Number Generation as a Service.
 """
 
-from .client import QRNGClient, EntropyResult, HealthStatus
+from .client import QRNGClient, EntropyResult, HealthStatus, get_session
 from .errors import QRNGError, AuthenticationError, RateLimitError, QuotaExceededError
-from .streaming import QRNGStreamClient
+from .streaming import QRNGStreamClient, QRNGStreamPool
 
 __version__ = "1.0.0"
 __all__ = [
     "QRNGClient",
     "QRNGStreamClient",
+    "QRNGStreamPool",
     "EntropyResult",
     "HealthStatus",
+    "get_session",
     "QRNGError",
     "AuthenticationError",
     "RateLimitError",
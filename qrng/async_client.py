@@ -0,0 +1,186 @@
+"""QRNG API asyncio REST client (requires aiohttp)."""
+
+import aiohttp
+from types import TracebackType
+from typing import Any, Dict, Optional, Type
+
+from .client import (
+    EntropyResult,
+    HealthStatus,
+    FormatType,
+    MethodType,
+    SignatureType,
+    POOL_MAXSIZE,
+    _loads,
+)
+from .errors import QRNGError, AuthenticationError, RateLimitError, QuotaExceededError
+
+
+class AsyncQRNGClient:
+    """
+    QRNG API asyncio REST client.
+    
+    Concurrent generate() calls share one connection pool on a single event
+    loop, so fanning out many requests needs no extra threads.
+    
+    Example:
+        >>> async with AsyncQRNGClient(api_key="qnrk_...") as client:
+        ...     results = await asyncio.gather(
+        ...         *(client.generate(bytes=32) for _ in range(10))
+        ...     )
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://qrngapi.com",
+        timeout: int = 30,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        """
+        Initialize async QRNG client.
+        
+        Args:
+            api_key: Your QRNG API key
+            base_url: API base URL (default: https://qrngapi.com)
+            timeout: Request timeout in seconds
+            session: Optional aiohttp.ClientSession to use. By default one is
+                     created on first request and closed by close(); a
+                     session passed in here is left open
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._owns_session = session is None
+        self._session = session
+        self._headers = {"X-API-Key": api_key}
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        # aiohttp sessions must be created inside the running event loop.
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=POOL_MAXSIZE),
+                timeout=self.timeout,
+            )
+        return self._session
+    
+    async def generate(
+        self,
+        bytes: int = 32,
+        format: FormatType = "hex",
+        method: Optional[MethodType] = None,
+        signature_type: Optional[SignatureType] = None,
+    ) -> EntropyResult:
+        """
+        Generate random entropy.
+        
+        Args:
+            bytes: Number of random bytes to generate (1-1024)
+            format: Output format (hex, base64, binary, uint8, uint32)
+            method: Quantum method (auto, photon, tunneling, vacuum, simulator)
+            signature_type: Signature type (ed25519, dilithium2, dilithium3, dilithium5)
+                           PQC signatures require Pro tier or higher
+        
+        Returns:
+            EntropyResult with random data and cryptographic proof
+        
+        Raises:
+            AuthenticationError: Invalid API key
+            RateLimitError: Rate limit exceeded
+            QuotaExceededError: Monthly quota exceeded
+            QRNGError: Other API errors
+        """
+        params: Dict[str, Any] = {
+            "bytes": bytes,
+            "format": format,
+        }
+        
+        if method:
+            params["method"] = method
+        if signature_type:
+            params["signatureType"] = signature_type
+        
+        try:
+            async with self._get_session().get(
+                f"{self.base_url}/api/random",
+                params=params,
+                headers=self._headers,
+                timeout=self.timeout
+            ) as response:
+                body = await response.read()
+                
+                status = response.status
+                if not 200 <= status < 300:
+                    if status == 401:
+                        raise AuthenticationError("Invalid API key")
+                    elif status == 429:
+                        raise RateLimitError("Rate limit exceeded")
+                    elif status == 402:
+                        raise QuotaExceededError("Monthly quota exceeded")
+                    # The API answers in JSON; anything else means no error details.
+                    try:
+                        data = _loads(body)
+                    except ValueError:
+                        data = {}
+                    if not isinstance(data, dict):
+                        data = {}
+                    raise QRNGError(
+                        data.get("error", f"HTTP {status}"),
+                        status_code=status,
+                        response=data
+                    )
+                
+                try:
+                    data = _loads(body)
+                except ValueError as e:
+                    raise QRNGError(f"Request failed: invalid JSON response: {e}")
+            
+            return EntropyResult._from_response(data, format)
+        
+        except aiohttp.ClientError as e:
+            raise QRNGError(f"Request failed: {e}")
+    
+    async def health(self) -> HealthStatus:
+        """
+        Get system health status.
+        
+        Returns:
+            HealthStatus with NIST test results
+        """
+        try:
+            async with self._get_session().get(
+                f"{self.base_url}/api/health",
+                headers=self._headers,
+                timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                try:
+                    data = _loads(await response.read())
+                except ValueError as e:
+                    raise QRNGError(f"Health check failed: invalid JSON response: {e}")
+            
+            return HealthStatus(
+                status=data["status"],
+                metrics=data["metrics"],
+                timestamp=data["timestamp"]
+            )
+        
+        except aiohttp.ClientError as e:
+            raise QRNGError(f"Health check failed: {e}")
+    
+    async def close(self) -> None:
+        """Close the session if this client created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def __aenter__(self) -> "AsyncQRNGClient":
+        return self
+    
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        await self.close()
@@ -0,0 +1,112 @@
+"""QRNG API asyncio WebSocket streaming client (requires aiohttp)."""
+
+import asyncio
+import json
+import sys
+import aiohttp
+from typing import AsyncIterator, Optional, Union
+
+from .client import FormatType, _loads
+from .errors import QRNGError
+from .streaming import _stream_url
+
+
+def install_uvloop() -> bool:
+    """
+    Switch asyncio to uvloop's libuv-based event loop, if it is available.
+    
+    Not done on import, since the event loop policy is process-wide and
+    belongs to the application. Call it once at startup, before the event
+    loop is created. uvloop is not available on Windows.
+    
+    Returns:
+        True if uvloop is now the event loop policy
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+class QRNGAsyncStreamClient:
+    """
+    QRNG API asyncio WebSocket streaming client.
+    
+    Chunks are delivered on the caller's event loop, so many streams can run
+    concurrently without a thread per stream.
+    
+    Example:
+        >>> client = QRNGAsyncStreamClient(api_key="qnrk_...")
+        >>> async for chunk in client.stream(chunk_size=32, format="hex"):
+        ...     print(f"Received: {chunk}")
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "wss://qrngapi.com",
+        session: Optional[aiohttp.ClientSession] = None
+    ):
+        """
+        Initialize async streaming client.
+        
+        Args:
+            api_key: Your QRNG API key
+            base_url: WebSocket base URL (default: wss://qrngapi.com)
+            session: Optional aiohttp.ClientSession to open the WebSocket on.
+                     By default a session is created per stream() call
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.session = session
+    
+    async def stream(
+        self,
+        chunk_size: int = 32,
+        format: FormatType = "hex",
+        binary: bool = False
+    ) -> AsyncIterator[Union[str, bytes]]:
+        """
+        Connect and yield entropy chunks as they arrive.
+        
+        Args:
+            chunk_size: Size of each chunk in bytes (1-1024)
+            format: Output format
+            binary: Ask the server for binary frames, yielded as raw bytes
+                    without any JSON parsing
+        
+        Yields:
+            Each data chunk (str for text frames, bytes for binary frames)
+        
+        Raises:
+            QRNGError: The server reported an error or the connection failed
+        """
+        ws_url = _stream_url(self.base_url, chunk_size, format, binary)
+        
+        session = self.session or aiohttp.ClientSession()
+        try:
+            async with session.ws_connect(ws_url, heartbeat=20) as ws:
+                await ws.send_str(json.dumps({"apiKey": self.api_key}))
+                async for msg in ws:
+                    if msg.type == aiohttp.WSMsgType.BINARY:
+                        yield msg.data
+                    elif msg.type == aiohttp.WSMsgType.TEXT:
+                        try:
+                            data = msg.json(loads=_loads)
+                        except ValueError as e:
+                            raise QRNGError(f"Malformed stream message: {e}")
+                        if "error" in data:
+                            raise QRNGError(data["error"])
+                        elif "data" in data:
+                            yield data["data"]
+                    elif msg.type == aiohttp.WSMsgType.ERROR:
+                        raise QRNGError(str(ws.exception()))
+        except aiohttp.ClientError as e:
+            raise QRNGError(f"Stream failed: {e}")
+        finally:
+            if session is not self.session:
+                await session.close()
@@ -1,21 +1,178 @@
 """QRNG API REST client."""
 
+import base64
+import functools
+import hashlib
+import random
+import struct
+import threading
+import time
 import requests
-from typing import Optional, Dict, Any, Literal
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+from typing import (
+    TYPE_CHECKING, Optional, Dict, Any, Literal, Callable, ClassVar, Mapping, Protocol, Tuple,
+    Type, Union, cast
+)
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode
 
 from .errors import QRNGError, AuthenticationError, RateLimitError, QuotaExceededError
 
+if TYPE_CHECKING:
+    import numpy
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional "fast" extra
+    import json
+    _loads = json.loads
+
+try:
+    import pybase64
+    _b64decode = pybase64.b64decode
+except ImportError:  # pragma: no cover - optional "fast" extra
+    _b64decode = base64.b64decode
+
 
 FormatType = Literal["hex", "base64", "binary", "uint8", "uint32"]
 MethodType = Literal["auto", "photon", "tunneling", "vacuum", "simulator"]
 SignatureType = Literal["ed25519", "dilithium2", "dilithium3", "dilithium5"]
+CachePolicy = Literal["enabled", "replay", "disabled"]
+
+# Maximum number of signature verification outcomes kept in memory.
+VERIFY_CACHE_MAXSIZE = 1024
+
+# Largest payload the API serves in a single request.
+MAX_BYTES_PER_REQUEST = 1024
+
+# Binary/base64 requests above this size are streamed into a preallocated
+# buffer instead of going through requests' chunked content assembly.
+STREAM_THRESHOLD = 256
+
+# Responses that generate() waits out and retries.
+RETRY_STATUSES = (429, 503)
+
+# After a 429 lowered the client-side rate limit, each quiet period of this
+# many seconds raises it by a quarter of the configured limit again.
+RATE_RECOVERY_INTERVAL = 60.0
+
+# All traffic goes to a single host, so one pool with plenty of keep-alive
+# sockets beats the requests default of 10 pools x 10 connections.
+POOL_MAXSIZE = 32
+
+
+def _build_adapter() -> HTTPAdapter:
+    """Create an HTTPAdapter tuned for concurrent calls against one host."""
+    # 429 and 503 are left to QRNGClient.generate(), which honours
+    # Retry-After and feeds the client-side rate limiter.
+    retries = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(502, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    )
+    return HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE, max_retries=retries)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _decode_payload(data: Any, fmt: str) -> bytes:
+    """Decode the data field of a /api/random response into raw bytes."""
+    if fmt == "hex":
+        return bytes.fromhex(data)
+    elif fmt == "base64":
+        return cast(bytes, _b64decode(data))
+    elif fmt == "uint8":
+        return bytes(data)
+    elif fmt == "uint32":
+        return struct.pack(f"<{len(data)}I", *data)
+    raise ValueError(f"Cannot decode {fmt!r} payloads to bytes")
 
 
-@dataclass
-class EntropyResult:
+class _FrozenSlots:
+    """
+    Pickle support for frozen dataclasses that declare __slots__ by hand.
+    
+    Results are created in bulk, so they use __slots__ instead of a
+    per-instance __dict__. The slots are declared in the class body rather
+    than with dataclass(slots=True), which needs Python 3.10 and turns
+    private cache slots into dataclass fields.
+    """
+    
+    __slots__ = ()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = {}
+        name: str
+        for name in self.__slots__:
+            if hasattr(self, name):
+                state[name] = getattr(self, name)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # The default restores slots with setattr, which frozen classes reject.
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+_SHARED_SESSION: Optional[requests.Session] = None
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the module-level session shared by all clients.
+    
+    The session is created on first use and reused afterwards, so clients
+    created per request (e.g. in serverless handlers) still benefit from
+    keep-alive connections. It carries no credentials; each client sends
+    its own API key per request.
+    """
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        with _SHARED_SESSION_LOCK:
+            if _SHARED_SESSION is None:
+                session = requests.Session()
+                adapter = _build_adapter()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SHARED_SESSION = session
+    return _SHARED_SESSION
+
+
+@dataclass(frozen=True)
+class EntropyResult(_FrozenSlots):
     """Result from entropy generation."""
     
+    # _digest and _format are bare slots, not fields, so they stay out of
+    # repr(), comparisons, fields() and asdict().
+    __slots__ = (
+        "data", "proof_id", "signature", "public_key", "signature_type", "metadata",
+        "_digest", "_format"
+    )
+    
     data: str
     proof_id: str
     signature: str
@@ -23,8 +180,103 @@ class EntropyResult:
     signature_type: str
     metadata: Dict[str, Any]
     
-    def verify(self) -> bool:
-        """Verify the cryptographic signature (requires verification libraries)."""
+    # Verification outcomes keyed by _verify_key(), shared by all results and
+    # evicted oldest-first.
+    _verify_cache: ClassVar["OrderedDict[bytes, bool]"] = OrderedDict()
+    _verify_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    @property
+    def digest(self) -> bytes:
+        """SHA256(proof_id || signature || public_key), computed once per result."""
+        digest = getattr(self, "_digest", None)
+        if digest is None:
+            digest = hashlib.sha256(
+                (self.proof_id + self.signature + self.public_key).encode()
+            ).digest()
+            object.__setattr__(self, "_digest", digest)
+        return digest
+    
+    def __hash__(self) -> int:
+        return int.from_bytes(self.digest[:8], "little")
+    
+    def _verify_key(self) -> bytes:
+        """Hash of everything the verification outcome depends on, signed data included."""
+        h = hashlib.sha256()
+        signed = (self.data, self.signature_type, self.proof_id, self.signature, self.public_key)
+        for value in signed:
+            part = (value if isinstance(value, str) else repr(value)).encode()
+            # Length prefixes keep field boundaries unambiguous.
+            h.update(len(part).to_bytes(8, "big"))
+            h.update(part)
+        return h.digest()
+    
+    def verify(self, cache_policy: CachePolicy = "enabled") -> bool:
+        """
+        Verify the cryptographic signature (requires verification libraries).
+        
+        Args:
+            cache_policy: "enabled" reuses and stores cached outcomes,
+                          "replay" only serves cached outcomes and raises on
+                          a miss (for deterministic offline tests), "disabled"
+                          always verifies from scratch
+        
+        Raises:
+            QRNGError: No cached outcome exists under the "replay" policy
+        """
+        if cache_policy == "disabled":
+            return self._verify_signature()
+        
+        key = self._verify_key()
+        with self._verify_cache_lock:
+            cached = self._verify_cache.get(key)
+            if cached is not None:
+                self._verify_cache.move_to_end(key)
+                return cached
+        
+        if cache_policy == "replay":
+            raise QRNGError(f"No cached verification result for proof {self.proof_id}")
+        
+        result = self._verify_signature()
+        with self._verify_cache_lock:
+            self._verify_cache[key] = result
+            if len(self._verify_cache) > VERIFY_CACHE_MAXSIZE:
+                self._verify_cache.popitem(last=False)
+        return result
+    
+    @classmethod
+    def _from_response(cls, data: Dict[str, Any], format: FormatType) -> "EntropyResult":
+        """Build a result from a /api/random response body, recording its format."""
+        result = cls(
+            data=data["data"],
+            proof_id=data["proofId"],
+            signature=data["signature"],
+            public_key=data["publicKey"],
+            signature_type=data["signatureType"],
+            metadata=data.get("metadata", {})
+        )
+        object.__setattr__(result, "_format", format)
+        return result
+    
+    def raw_bytes(self) -> bytes:
+        """
+        Decode the data to raw bytes, using the format it was requested in.
+        
+        Base64 is decoded with pybase64's SIMD decoder when the "fast" extra
+        is installed.
+        
+        Returns:
+            The random bytes
+        
+        Raises:
+            ValueError: The result was not returned by a client, so its format
+                        is unknown, or the format cannot be decoded to bytes
+        """
+        format = getattr(self, "_format", None)
+        if format is None:
+            raise ValueError("Result format is unknown; decode the data directly")
+        return _decode_payload(self.data, format)
+    
+    def _verify_signature(self) -> bool:
         # Implementation note: Users should install verification libraries
         # ed25519: python-ed25519 or cryptography
         # dilithium: use @noble/post-quantum via subprocess or FFI
@@ -34,44 +286,148 @@ class EntropyResult:
         )
 
 
-@dataclass
-class HealthStatus:
+@dataclass(frozen=True)
+class HealthStatus(_FrozenSlots):
     """System health metrics."""
     
+    __slots__ = ("status", "metrics", "timestamp")
+    
     status: str
     metrics: Dict[str, Any]
     timestamp: str
 
 
-class QRNGClient:
+class _Response(Protocol):
+    """The parts of a requests or httpx response the clients rely on."""
+    
+    status_code: int
+    
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+    
+    @property
+    def content(self) -> bytes: ...
+    
+    def close(self) -> None: ...
+    
+    def raise_for_status(self) -> Any: ...
+
+
+class _Session(Protocol):
+    """The parts of a requests or httpx session _BaseClient relies on."""
+    
+    def close(self) -> None: ...
+
+
+class _BaseClient:
     """
-    QRNG API REST client.
+    Transport-independent part of the REST clients.
     
-    Example:
-        >>> client = QRNGClient(api_key="qnrk_...")
-        >>> result = client.generate(bytes=32, format="hex")
-        >>> print(result.data)
+    Rate limiting, retries, response parsing and the generate_*() helpers
+    live here; subclasses supply the HTTP session through _get() and
+    _read_body().
     """
     
+    session: _Session
+    
+    # Exceptions raised by the underlying HTTP library for transport failures.
+    _transport_errors: Tuple[Type[Exception], ...] = ()
+    
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://qrngapi.com",
-        timeout: int = 30
+        timeout: int = 30,
+        rpm_limit: Optional[int] = None,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        max_retry_wait: float = 60.0
     ):
         """
-        Initialize QRNG client.
+        Set up the transport-independent state. Arguments are documented on
+        QRNGClient.__init__.
         
-        Args:
-            api_key: Your QRNG API key
-            base_url: API base URL (default: https://qrngapi.com)
-            timeout: Request timeout in seconds
+        Raises:
+            ValueError: rpm_limit is not a positive number
         """
+        if rpm_limit is not None and rpm_limit <= 0:
+            raise ValueError(f"rpm_limit must be positive, got {rpm_limit}")
+        
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._random_url = f"{self.base_url}/api/random"
+        self._health_url = f"{self.base_url}/api/health"
+        # Shared, never mutated: reused for the common generate() call.
+        self._default_params = {"bytes": 32, "format": "hex"}
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({"X-API-Key": api_key})
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_retry_wait = max_retry_wait
+        # Subclasses set session, and whether close() should close it.
+        self._owns_session = False
+        # Sent per request rather than stored on the session, which may be
+        # shared between clients using different API keys.
+        self._headers = {"X-API-Key": api_key}
+        self._buffer = bytearray()
+        self._buffer_source: tuple = (None, None)
+        self._buffer_lock = threading.Lock()
+        self._rpm_limit = rpm_limit
+        # Only read when a limit is set.
+        self._rpm_configured = rpm_limit or 0
+        self._last_backoff = time.monotonic()
+        self._tokens = float(rpm_limit or 0)
+        self._last_update = time.monotonic()
+        self._rate_lock = threading.Lock()
+    
+    def _acquire(self) -> None:
+        """Block until the token bucket allows another request."""
+        if self._rpm_limit is None:
+            return
+        with self._rate_lock:
+            rpm = self._rpm_limit
+            now = time.monotonic()
+            if rpm < self._rpm_configured and now - self._last_backoff >= RATE_RECOVERY_INTERVAL:
+                # No 429 for a while: step back toward the configured limit.
+                rpm = min(self._rpm_configured, rpm + max(1, self._rpm_configured // 4))
+                self._rpm_limit = rpm
+                self._last_backoff = now
+            elapsed = now - self._last_update
+            self._tokens = min(rpm, self._tokens + elapsed * rpm / 60)
+            self._last_update = now
+            if self._tokens < 1:
+                # Sleeping under the lock queues other callers behind us.
+                time.sleep((1 - self._tokens) * 60 / rpm)
+                self._tokens = 1.0
+                self._last_update = time.monotonic()
+            self._tokens -= 1
+    
+    def _backoff_rate(self) -> None:
+        """Lower the client-side limit after the server rejected a request."""
+        if self._rpm_limit is None:
+            return
+        with self._rate_lock:
+            self._rpm_limit = max(1, self._rpm_limit * 3 // 4)
+            self._tokens = 0.0
+            self._last_update = self._last_backoff = time.monotonic()
+    
+    def _retry_delay(self, response: _Response, attempt: int) -> float:
+        """Seconds to wait before retrying, honouring Retry-After when present."""
+        delay = _parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = self.retry_backoff * 2 ** attempt + random.uniform(0, 0.1)
+        return delay
+    
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> _Response:
+        raise NotImplementedError
+    
+    def _read_body(self, response: _Response) -> Union[bytes, bytearray]:
+        """Read the body of a response sent with stream=True."""
+        return response.content
     
     def generate(
         self,
@@ -90,60 +446,224 @@ class QRNGClient:
             signature_type: Signature type (ed25519, dilithium2, dilithium3, dilithium5)
                            PQC signatures require Pro tier or higher
         
+        Note:
+            "hex" doubles the payload on the wire and costs a second decode
+            pass; bulk consumers should prefer generate_bytes().
+        
         Returns:
             EntropyResult with random data and cryptographic proof
         
         Raises:
             AuthenticationError: Invalid API key
-            RateLimitError: Rate limit exceeded
+            RateLimitError: Rate limit exceeded after max_retries retries
             QuotaExceededError: Monthly quota exceeded
             QRNGError: Other API errors
         """
-        params = {
-            "bytes": bytes,
-            "format": format,
-        }
+        if bytes == 32 and format == "hex" and not method and not signature_type:
+            params = self._default_params
+        else:
+            params = {
+                "bytes": bytes,
+                "format": format,
+            }
+            
+            if method:
+                params["method"] = method
+            if signature_type:
+                params["signatureType"] = signature_type
         
-        if method:
-            params["method"] = method
-        if signature_type:
-            params["signatureType"] = signature_type
+        stream = format in ("binary", "base64") and bytes > STREAM_THRESHOLD
+        return self._fetch_entropy(
+            lambda: self._get(self._random_url, params, stream=stream),
+            stream,
+            format
+        )
+    
+    def prepare_generator(
+        self,
+        format: FormatType = "hex",
+        method: Optional[MethodType] = None,
+        signature_type: Optional[SignatureType] = None,
+    ) -> Callable[[int], EntropyResult]:
+        """
+        Build a generate() for a fixed format, method and signature type.
         
+        Args:
+            format: Output format (hex, base64, binary, uint8, uint32)
+            method: Quantum method (auto, photon, tunneling, vacuum, simulator)
+            signature_type: Signature type (ed25519, dilithium2, dilithium3, dilithium5)
+        
+        Returns:
+            Function mapping a byte count (1-1024) to an EntropyResult, with
+            the same errors as generate()
+        """
+        return functools.partial(
+            self.generate, format=format, method=method, signature_type=signature_type
+        )
+    
+    def _fetch_entropy(
+        self,
+        send: Callable[[], _Response],
+        stream: bool,
+        format: FormatType
+    ) -> EntropyResult:
+        """Send a /api/random request with retries and parse the result."""
         try:
-            response = self.session.get(
-                f"{self.base_url}/api/random",
-                params=params,
-                timeout=self.timeout
-            )
+            # GET /api/random is idempotent, so transient 429/503 responses
+            # are safe to retry.
+            backed_off = False
+            for attempt in range(self.max_retries + 1):
+                self._acquire()
+                response = send()
+                if response.status_code == 429 and "Retry-After" in response.headers:
+                    # Retries of one call all hit the same overload; cut once.
+                    if not backed_off:
+                        self._backoff_rate()
+                        backed_off = True
+                if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                    break
+                delay = self._retry_delay(response, attempt)
+                if delay > self.max_retry_wait:
+                    break
+                response.close()
+                time.sleep(delay)
             
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key")
-            elif response.status_code == 429:
-                raise RateLimitError("Rate limit exceeded")
-            elif response.status_code == 402:
-                raise QuotaExceededError("Monthly quota exceeded")
-            elif not response.ok:
-                data = response.json() if response.headers.get("content-type") == "application/json" else {}
+            status = response.status_code
+            if not 200 <= status < 300:
+                if status == 401:
+                    raise AuthenticationError("Invalid API key")
+                elif status == 429:
+                    raise RateLimitError("Rate limit exceeded")
+                elif status == 402:
+                    raise QuotaExceededError("Monthly quota exceeded")
+                # The API answers in JSON; anything else means no error details.
+                try:
+                    data = _loads(response.content)
+                except ValueError:
+                    data = {}
+                if not isinstance(data, dict):
+                    data = {}
                 raise QRNGError(
-                    data.get("error", f"HTTP {response.status_code}"),
-                    status_code=response.status_code,
+                    data.get("error", f"HTTP {status}"),
+                    status_code=status,
                     response=data
                 )
             
-            data = response.json()
+            body = self._read_body(response) if stream else response.content
+            try:
+                data = _loads(body)
+            except ValueError as e:
+                raise QRNGError(f"Request failed: invalid JSON response: {e}")
             
-            return EntropyResult(
-                data=data["data"],
-                proof_id=data["proofId"],
-                signature=data["signature"],
-                public_key=data["publicKey"],
-                signature_type=data["signatureType"],
-                metadata=data.get("metadata", {})
-            )
+            return EntropyResult._from_response(data, format)
             
-        except requests.exceptions.RequestException as e:
+        except self._transport_errors as e:
             raise QRNGError(f"Request failed: {e}")
     
+    def generate_bytes(
+        self,
+        nbytes: int = 32,
+        method: Optional[MethodType] = None,
+        signature_type: Optional[SignatureType] = None,
+    ) -> bytes:
+        """
+        Generate random entropy as raw bytes.
+        
+        Fetches the data base64 encoded (4/3 of the raw size on the wire versus
+        2x for hex) and decodes it client-side. Use generate() if you need the
+        proof and signature.
+        
+        Args:
+            nbytes: Number of random bytes to generate (1-1024)
+            method: Quantum method (auto, photon, tunneling, vacuum, simulator)
+            signature_type: Signature type (ed25519, dilithium2, dilithium3, dilithium5)
+        
+        Returns:
+            The random bytes
+        """
+        result = self.generate(
+            bytes=nbytes,
+            format="base64",
+            method=method,
+            signature_type=signature_type,
+        )
+        return result.raw_bytes()
+    
+    def generate_buffered(
+        self,
+        nbytes: int = 32,
+        method: Optional[MethodType] = None,
+        signature_type: Optional[SignatureType] = None,
+    ) -> bytes:
+        """
+        Serve small entropy requests from a locally buffered 1024-byte block.
+        
+        Calling generate(bytes=32) in a loop pays a full HTTP round trip and
+        headers for every 32 bytes. This method fetches the maximum block once
+        and hands out slices until it runs dry.
+        
+        Note:
+            One proof and signature covers the whole fetched block, not each
+            slice, and they are not returned here. The buffer is discarded
+            whenever method or signature_type differ from the previous call,
+            so bytes are never served under a different signature than the
+            one they were fetched with.
+        
+        Args:
+            nbytes: Number of random bytes to return
+            method: Quantum method (auto, photon, tunneling, vacuum, simulator)
+            signature_type: Signature type (ed25519, dilithium2, dilithium3, dilithium5)
+        
+        Returns:
+            The random bytes
+        
+        Raises:
+            ValueError: nbytes is negative
+        """
+        if nbytes < 0:
+            raise ValueError(f"nbytes must not be negative, got {nbytes}")
+        
+        source = (method, signature_type)
+        with self._buffer_lock:
+            if source != self._buffer_source:
+                self._buffer.clear()
+                self._buffer_source = source
+            while len(self._buffer) < nbytes:
+                self._buffer += self.generate_bytes(
+                    MAX_BYTES_PER_REQUEST, method=method, signature_type=signature_type
+                )
+            chunk = bytes(memoryview(self._buffer)[:nbytes])
+            del self._buffer[:nbytes]
+        return chunk
+    
+    def generate_uint32(
+        self,
+        n: int,
+        method: Optional[MethodType] = None,
+        signature_type: Optional[SignatureType] = None,
+    ) -> "numpy.ndarray":
+        """
+        Generate random little-endian uint32 values as a NumPy array.
+        
+        Unlike generate(format="uint32"), which parses a JSON list into one
+        Python int per value, the data is fetched as base64 and reinterpreted
+        in place, so the array holds exactly 4 bytes per value.
+        
+        Requires numpy (``pip install "qrng-api[numpy]"``).
+        
+        Args:
+            n: Number of uint32 values to generate (1-256)
+            method: Quantum method (auto, photon, tunneling, vacuum, simulator)
+            signature_type: Signature type (ed25519, dilithium2, dilithium3, dilithium5)
+        
+        Returns:
+            Writable numpy.ndarray of dtype uint32 with n elements
+        """
+        import numpy
+        
+        raw = bytearray(self.generate_bytes(4 * n, method=method, signature_type=signature_type))
+        return numpy.frombuffer(raw, dtype="<u4", count=n)
+    
     def health(self) -> HealthStatus:
         """
         Get system health status.
@@ -152,12 +672,12 @@ class QRNGClient:
             HealthStatus with NIST test results
         """
         try:
-            response = self.session.get(
-                f"{self.base_url}/api/health",
-                timeout=self.timeout
-            )
+            response = self._get(self._health_url)
             response.raise_for_status()
-            data = response.json()
+            try:
+                data = _loads(response.content)
+            except ValueError as e:
+                raise QRNGError(f"Health check failed: invalid JSON response: {e}")
             
             return HealthStatus(
                 status=data["status"],
@@ -165,15 +685,191 @@ class QRNGClient:
                 timestamp=data["timestamp"]
             )
             
-        except requests.exceptions.RequestException as e:
+        except self._transport_errors as e:
             raise QRNGError(f"Health check failed: {e}")
     
     def close(self):
-        """Close the session."""
-        self.session.close()
+        """Close the session if this client created it."""
+        if self._owns_session:
+            self.session.close()
     
     def __enter__(self):
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class QRNGClient(_BaseClient):
+    """
+    QRNG API REST client.
+    
+    Example:
+        >>> client = QRNGClient(api_key="qnrk_...")
+        >>> result = client.generate(bytes=32, format="hex")
+        >>> print(result.data)
+    """
+    
+    session: requests.Session
+    
+    _transport_errors = (requests.exceptions.RequestException,)
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://qrngapi.com",
+        timeout: int = 30,
+        session: Optional[requests.Session] = None,
+        rpm_limit: Optional[int] = None,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        max_retry_wait: float = 60.0
+    ):
+        """
+        Initialize QRNG client.
+        
+        Args:
+            api_key: Your QRNG API key
+            base_url: API base URL (default: https://qrngapi.com)
+            timeout: Request timeout in seconds
+            session: Optional requests.Session to use. Defaults to the shared
+                     session returned by get_session(). The client only
+                     closes sessions it created itself, so neither is closed
+                     by close()
+            rpm_limit: Optional client-side limit in requests per minute.
+                       Calls are throttled locally with a token bucket instead
+                       of spending a round trip on a 429. The limit is lowered
+                       automatically when the server still answers 429 with
+                       a Retry-After header (at most once per generate()
+                       call) and recovers step by step once the server
+                       stops answering 429
+            max_retries: How often generate() retries a 429 or 503 response
+                         before raising
+            retry_backoff: Base delay in seconds for exponential backoff when
+                           the server sends no Retry-After header
+            max_retry_wait: Longest delay in seconds generate() will wait
+                            before a retry. If the server asks for more, the
+                            error is raised at once
+        
+        Raises:
+            ValueError: rpm_limit is not a positive number
+        """
+        super().__init__(
+            api_key, base_url, timeout, rpm_limit, max_retries, retry_backoff, max_retry_wait
+        )
+        self.session = session if session is not None else get_session()
+    
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> requests.Response:
+        return self.session.get(
+            url,
+            params=params,
+            headers=self._headers,
+            timeout=self.timeout,
+            stream=stream
+        )
+    
+    def _read_body(self, response: _Response) -> Union[bytes, bytearray]:
+        """
+        Read a streamed response body into a single preallocated buffer.
+        
+        Falls back to response.content when the decoded size is not known up
+        front (no Content-Length, or a compressed body).
+        """
+        length = response.headers.get("Content-Length")
+        if not length or "Content-Encoding" in response.headers:
+            return response.content
+        raw = cast(requests.Response, response).raw
+        
+        buf = bytearray(int(length))
+        view = memoryview(buf)
+        read = 0
+        try:
+            while read < len(buf):
+                n = raw.readinto(view[read:])
+                if not n:
+                    break
+                read += n
+        except Urllib3HTTPError as e:
+            # Raw reads bypass requests' exception wrapping.
+            raise QRNGError(f"Request failed: {e}")
+        finally:
+            view.release()
+            response.close()
+        
+        if read < len(buf):
+            raise QRNGError(f"Incomplete response: expected {len(buf)} bytes, got {read}")
+        return buf
+    
+    def prepare_generator(
+        self,
+        format: FormatType = "hex",
+        method: Optional[MethodType] = None,
+        signature_type: Optional[SignatureType] = None,
+    ) -> Callable[[int], EntropyResult]:
+        """
+        Build a fast generate() for a fixed format, method and signature type.
+        
+        The returned function takes only the byte count. Requests are prepared
+        once per distinct byte count and then sent as-is, skipping the URL
+        encoding and header merging that generate() repeats on every call.
+        Useful in tight loops issuing many identically shaped requests.
+        
+        Note:
+            Session cookies, auth and headers, and proxy/CA settings from the
+            environment, are captured when the generator is built. Later
+            changes to the session or environment do not reach it; build a
+            new generator instead.
+        
+        Example:
+            >>> gen = client.prepare_generator(format="base64")
+            >>> results = [gen(64) for _ in range(100)]
+        
+        Args:
+            format: Output format (hex, base64, binary, uint8, uint32)
+            method: Quantum method (auto, photon, tunneling, vacuum, simulator)
+            signature_type: Signature type (ed25519, dilithium2, dilithium3, dilithium5)
+        
+        Returns:
+            Function mapping a byte count (1-1024) to an EntropyResult, with
+            the same errors as generate()
+        """
+        params: Dict[str, str] = {"format": format}
+        if method:
+            params["method"] = method
+        if signature_type:
+            params["signatureType"] = signature_type
+        
+        template = self.session.prepare_request(
+            requests.Request("GET", self._random_url, params=params, headers=self._headers)
+        )
+        # Proxy/CA settings from the environment, normally merged per request.
+        settings = self.session.merge_environment_settings(template.url, {}, None, None, None)
+        proxies, verify, cert = settings["proxies"], settings["verify"], settings["cert"]
+        prepared_by_size: Dict[int, requests.PreparedRequest] = {}
+        
+        def generate(bytes: int = 32) -> EntropyResult:
+            prepared = prepared_by_size.get(bytes)
+            if prepared is None:
+                prepared = template.copy()
+                prepared.url = f"{template.url}&{urlencode({'bytes': bytes})}"
+                prepared_by_size[bytes] = prepared
+            stream = format in ("binary", "base64") and bytes > STREAM_THRESHOLD
+            return self._fetch_entropy(
+                lambda: self.session.send(
+                    prepared,
+                    timeout=self.timeout,
+                    stream=stream,
+                    proxies=proxies,
+                    verify=verify,
+                    cert=cert
+                ),
+                stream,
+                format
+            )
+        
+        return generate
@@ -0,0 +1,75 @@
+"""QRNG API REST client over HTTP/2 (requires httpx[http2])."""
+
+import httpx
+from typing import Optional, Dict, Any
+
+from .client import _BaseClient, POOL_MAXSIZE
+
+
+class QRNGHttpxClient(_BaseClient):
+    """
+    QRNG API REST client using an HTTP/2 httpx transport.
+    
+    Same API as QRNGClient, but concurrent calls from multiple threads are
+    multiplexed over a single TLS connection with HPACK-compressed headers
+    instead of opening one HTTP/1.1 connection each.
+    
+    Example:
+        >>> client = QRNGHttpxClient(api_key="qnrk_...")
+        >>> result = client.generate(bytes=32, format="hex")
+        >>> print(result.data)
+    """
+    
+    session: httpx.Client
+    
+    _transport_errors = (httpx.HTTPError,)
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://qrngapi.com",
+        timeout: int = 30,
+        session: Optional[httpx.Client] = None,
+        **kwargs: Any
+    ):
+        """
+        Initialize HTTP/2 QRNG client.
+        
+        Args:
+            api_key: Your QRNG API key
+            base_url: API base URL (default: https://qrngapi.com)
+            timeout: Request timeout in seconds
+            session: Optional httpx.Client to use. By default an HTTP/2 client
+                     with up to 32 pooled connections is created and closed
+                     by close(); a client passed in here is left open
+            **kwargs: Further QRNGClient options (rpm_limit, max_retries, ...)
+        
+        Raises:
+            ValueError: rpm_limit is not a positive number
+        """
+        # Validate the options before creating anything that needs closing.
+        super().__init__(api_key, base_url, timeout, **kwargs)
+        if session is None:
+            session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=POOL_MAXSIZE,
+                    max_keepalive_connections=POOL_MAXSIZE,
+                ),
+            )
+            self._owns_session = True
+        self.session = session
+    
+    def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> httpx.Response:
+        # httpx.Client.get always reads the body; streaming is not needed here.
+        return self.session.get(
+            url,
+            params=params,
+            headers=self._headers,
+            timeout=self.timeout
+        )
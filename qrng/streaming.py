@@ -1,15 +1,58 @@
 """QRNG API WebSocket streaming client."""
 
 import json
+import logging
+import selectors
+import time
 import websocket
-from typing import Callable, Optional, Literal
-from threading import Thread
+from itertools import count
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Literal, Type, Union
+from threading import Lock, Thread, current_thread
 
 from .errors import QRNGError, AuthenticationError
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional "fast" extra
+    _loads = json.loads
+
 
 FormatType = Literal["hex", "base64", "binary", "uint8", "uint32"]
 
+logger = logging.getLogger(__name__)
+
+
+def _stream_url(base_url: str, chunk_size: int, format: str, binary: bool) -> str:
+    ws_url = f"{base_url}/api/stream?chunkSize={chunk_size}&format={format}"
+    if binary:
+        ws_url += "&binary=1"
+    return ws_url
+
+
+def _handle_message(
+    message: Union[str, bytes],
+    on_data: Callable[[Union[str, bytes]], None],
+    on_error: Optional[Callable[[Exception], None]]
+) -> None:
+    """Route one stream message to the data or error callback."""
+    try:
+        if isinstance(message, (bytes, bytearray)):
+            # Binary frames are bare payload; errors arrive as text.
+            on_data(message)
+            return
+        data = _loads(message)
+        if "error" in data:
+            error = QRNGError(data["error"])
+            if on_error:
+                on_error(error)
+        elif "data" in data:
+            on_data(data["data"])
+    except Exception as e:
+        if on_error:
+            on_error(e)
+
 
 class QRNGStreamClient:
     """
@@ -44,11 +87,12 @@ class QRNGStreamClient:
     
     def connect(
         self,
-        on_data: Callable[[str], None],
+        on_data: Callable[[Union[str, bytes]], None],
         chunk_size: int = 32,
         format: FormatType = "hex",
         on_error: Optional[Callable[[Exception], None]] = None,
-        on_close: Optional[Callable[[], None]] = None
+        on_close: Optional[Callable[[], None]] = None,
+        binary: bool = False
     ):
         """
         Connect and start streaming entropy.
@@ -59,21 +103,16 @@ class QRNGStreamClient:
             format: Output format
             on_error: Optional error callback
             on_close: Optional close callback
+            binary: Ask the server for binary frames. Binary frames are passed
+                    to on_data as raw bytes without any JSON parsing
         """
-        ws_url = f"{self.base_url}/api/stream?chunkSize={chunk_size}&format={format}"
+        ws_url = _stream_url(self.base_url, chunk_size, format, binary)
         
-        def on_ws_message(ws, message):
-            try:
-                data = json.loads(message)
-                if "error" in data:
-                    error = QRNGError(data["error"])
-                    if on_error:
-                        on_error(error)
-                elif "data" in data:
-                    on_data(data["data"])
-            except Exception as e:
-                if on_error:
-                    on_error(e)
+        def on_ws_data(ws, message, opcode, fin):
+            # With UTF-8 validation skipped, text frames arrive as bytes too.
+            if opcode == websocket.ABNF.OPCODE_TEXT:
+                message = message.decode("utf-8")
+            _handle_message(message, on_data, on_error)
         
         def on_ws_error(ws, error):
             if on_error:
@@ -90,12 +129,19 @@ class QRNGStreamClient:
         self.ws = websocket.WebSocketApp(
             ws_url,
             on_open=on_ws_open,
-            on_message=on_ws_message,
+            on_data=on_ws_data,
             on_error=on_ws_error,
             on_close=on_ws_close
         )
         
-        self.thread = Thread(target=self.ws.run_forever)
+        # Frames carry ASCII JSON, so per-frame UTF-8 validation is wasted work.
+        self.thread = Thread(
+            target=lambda: self.ws.run_forever(
+                skip_utf8_validation=True,
+                ping_interval=20,
+                ping_timeout=10
+            )
+        )
         self.thread.daemon = True
         self.thread.start()
     
@@ -105,3 +151,254 @@ class QRNGStreamClient:
             self.ws.close()
         if self.thread:
             self.thread.join(timeout=5)
+
+
+class _PooledStream:
+    """Connection and callbacks of one stream in a QRNGStreamPool."""
+    
+    __slots__ = (
+        "stream_id", "ws", "on_data", "on_error", "on_close", "last_seen", "ping_sent"
+    )
+    
+    def __init__(
+        self,
+        stream_id: int,
+        ws: websocket.WebSocket,
+        on_data: Callable[[Union[str, bytes]], None],
+        on_error: Optional[Callable[[Exception], None]],
+        on_close: Optional[Callable[[], None]]
+    ):
+        self.stream_id = stream_id
+        self.ws = ws
+        self.on_data = on_data
+        self.on_error = on_error
+        self.on_close = on_close
+        # Monotonic time of the last frame received, and of the unanswered
+        # keepalive ping if one is outstanding.
+        self.last_seen = time.monotonic()
+        self.ping_sent: Optional[float] = None
+
+
+class QRNGStreamPool:
+    """
+    Run many entropy streams on a single background thread.
+    
+    QRNGStreamClient uses one thread per stream. The pool instead waits on
+    all stream sockets with one selector and dispatches each frame to the
+    callbacks of its stream, so thread count stays at one however many
+    streams are open. The thread starts with the first stream and exits
+    once the last one is disconnected.
+    
+    Example:
+        >>> pool = QRNGStreamPool(api_key="qnrk_...")
+        >>> a = pool.connect(on_data=handle_a, chunk_size=32)
+        >>> b = pool.connect(on_data=handle_b, chunk_size=64, format="base64")
+        >>> # Data streams continuously...
+        >>> pool.disconnect(a)
+        >>> pool.close()
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "wss://qrngapi.com",
+        timeout: float = 10,
+        ping_interval: float = 20,
+        ping_timeout: float = 10
+    ):
+        """
+        Initialize stream pool.
+        
+        Args:
+            api_key: Your QRNG API key
+            base_url: WebSocket base URL (default: wss://qrngapi.com)
+            timeout: Socket timeout in seconds for the handshake and for
+                     reading the rest of a partially received frame. All
+                     streams share one thread, so a stream that stalls in
+                     the middle of a frame delays every other stream by up
+                     to this long
+            ping_interval: Seconds of silence on a stream before it is pinged
+            ping_timeout: Seconds to wait for any frame after a ping before
+                          the stream is closed as dead
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self._selector = selectors.DefaultSelector()
+        self._streams: Dict[int, _PooledStream] = {}
+        self._ids = count(1)
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+    
+    def connect(
+        self,
+        on_data: Callable[[Union[str, bytes]], None],
+        chunk_size: int = 32,
+        format: FormatType = "hex",
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_close: Optional[Callable[[], None]] = None,
+        binary: bool = False
+    ) -> int:
+        """
+        Open a stream and start dispatching its chunks.
+        
+        The WebSocket handshake happens in the calling thread; callbacks run
+        on the pool's thread.
+        
+        Args:
+            on_data: Callback function for each data chunk
+            chunk_size: Size of each chunk in bytes (1-1024)
+            format: Output format
+            on_error: Optional error callback
+            on_close: Optional close callback
+            binary: Ask the server for binary frames. Binary frames are passed
+                    to on_data as raw bytes without any JSON parsing
+        
+        Returns:
+            Stream ID to pass to disconnect()
+        
+        Raises:
+            QRNGError: Connection failed
+        """
+        ws_url = _stream_url(self.base_url, chunk_size, format, binary)
+        try:
+            ws = websocket.create_connection(
+                ws_url, timeout=self.timeout, skip_utf8_validation=True
+            )
+            ws.send(json.dumps({"apiKey": self.api_key}))
+        except (websocket.WebSocketException, OSError) as e:
+            raise QRNGError(f"Stream connection failed: {e}")
+        
+        with self._lock:
+            stream = _PooledStream(next(self._ids), ws, on_data, on_error, on_close)
+            self._streams[stream.stream_id] = stream
+            self._selector.register(ws, selectors.EVENT_READ, stream)
+            if self._thread is None:
+                self._thread = Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+        return stream.stream_id
+    
+    def disconnect(self, stream_id: int) -> None:
+        """Disconnect one stream."""
+        stream = self._remove(stream_id)
+        if stream:
+            # Don't wait for the server's close reply; nothing reads it now.
+            stream.ws.close(timeout=0)
+            if stream.on_close:
+                stream.on_close()
+    
+    def close(self) -> None:
+        """Disconnect all streams and stop the dispatcher thread."""
+        with self._lock:
+            stream_ids = list(self._streams)
+            thread = self._thread
+        for stream_id in stream_ids:
+            self.disconnect(stream_id)
+        if thread:
+            thread.join(timeout=5)
+    
+    def __enter__(self) -> "QRNGStreamPool":
+        return self
+    
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+    
+    def _remove(self, stream_id: int) -> Optional[_PooledStream]:
+        with self._lock:
+            stream = self._streams.pop(stream_id, None)
+            if stream:
+                self._selector.unregister(stream.ws)
+        return stream
+    
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if not self._streams:
+                        self._thread = None
+                        return
+                # The timeout bounds how long a newly empty pool keeps the
+                # thread, and how often keepalives are checked.
+                for key, _ in self._selector.select(timeout=1.0):
+                    self._read(key.data)
+                self._keepalive()
+        finally:
+            # If the loop died, let the next connect() start a new thread.
+            with self._lock:
+                if self._thread is current_thread():
+                    self._thread = None
+    
+    def _read(self, stream: _PooledStream) -> None:
+        ws = stream.ws
+        try:
+            while True:
+                opcode, data = ws.recv_data(control_frame=True)
+                stream.last_seen = time.monotonic()
+                stream.ping_sent = None
+                if opcode == websocket.ABNF.OPCODE_TEXT:
+                    _handle_message(data.decode("utf-8"), stream.on_data, stream.on_error)
+                elif opcode == websocket.ABNF.OPCODE_BINARY:
+                    _handle_message(data, stream.on_data, stream.on_error)
+                elif opcode == websocket.ABNF.OPCODE_CLOSE:
+                    self._closed(stream)
+                    return
+                # TLS may already hold decrypted frames the selector cannot see.
+                pending = getattr(ws.sock, "pending", None)
+                if not pending or not pending():
+                    return
+        except websocket.WebSocketTimeoutException:
+            # The rest of a partial frame is late. websocket-client keeps
+            # what was read so far, so resume once the socket is readable.
+            return
+        except Exception as e:
+            # Whatever went wrong (socket, malformed frame, a raising
+            # callback), only this stream is affected.
+            self._fail(stream, e)
+    
+    def _keepalive(self) -> None:
+        """Ping quiet streams and close those that stopped answering."""
+        now = time.monotonic()
+        with self._lock:
+            streams = list(self._streams.values())
+        for stream in streams:
+            if stream.ping_sent is not None:
+                if now - stream.ping_sent > self.ping_timeout:
+                    self._fail(stream, QRNGError("Stream keepalive timed out"))
+            elif now - stream.last_seen >= self.ping_interval:
+                try:
+                    stream.ws.ping()
+                    stream.ping_sent = now
+                except Exception as e:
+                    self._fail(stream, e)
+    
+    def _fail(self, stream: _PooledStream, error: Exception) -> None:
+        """Report an error on a stream and close it."""
+        if stream.stream_id in self._streams:
+            if not isinstance(error, QRNGError):
+                error = QRNGError(str(error))
+            _call(stream.on_error, error)
+            self._closed(stream)
+    
+    def _closed(self, stream: _PooledStream) -> None:
+        """Drop a stream the server closed (or that failed) and notify the caller."""
+        if self._remove(stream.stream_id):
+            stream.ws.shutdown()
+            _call(stream.on_close)
+
+
+def _call(callback: Optional[Callable[..., None]], *args: Any) -> None:
+    """Run a user callback on the pool thread without letting it kill the thread."""
+    if callback is None:
+        return
+    try:
+        callback(*args)
+    except Exception:
+        logger.exception("Error in stream callback %r", callback)
@@ -28,10 +28,27 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "requests>=2.25.0",
+        "requests>=2.26.0",
+        "urllib3>=1.26.0",
         "websocket-client>=1.0.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9",
+            "wsaccel>=0.6",
+            "brotli>=1.0",
+            "pybase64>=1.3",
+        ],
+        "numpy": [
+            "numpy>=1.20",
+        ],
+        "async": [
+            "aiohttp>=3.8",
+            "uvloop>=0.17; sys_platform != 'win32'",
+        ],
+        "http2": [
+            "httpx[http2]>=0.25",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
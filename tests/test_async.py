@@ -0,0 +1,177 @@
+"""Tests for the asyncio clients against a local aiohttp test server."""
+
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+pytest_asyncio = pytest.importorskip("pytest_asyncio")
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from qrng import QRNGError, AuthenticationError, RateLimitError, QuotaExceededError
+from qrng.async_client import AsyncQRNGClient
+from qrng.async_streaming import QRNGAsyncStreamClient
+
+
+pytestmark = pytest.mark.asyncio
+
+PAYLOAD = {
+    "data": "00ff",
+    "proofId": "proof-1",
+    "signature": "sig",
+    "publicKey": "key",
+    "signatureType": "ed25519",
+}
+
+
+@pytest_asyncio.fixture
+async def serve():
+    """Start an app on a local port and return its base URL."""
+    servers = []
+    
+    async def start(app):
+        server = TestServer(app)
+        await server.start_server()
+        servers.append(server)
+        return str(server.make_url("")).rstrip("/")
+    
+    yield start
+    for server in servers:
+        await server.close()
+
+
+def rest_app(status=200, body=PAYLOAD, path="/api/random", seen=None):
+    """Answer every request on path with a fixed reply, recording it in seen."""
+    async def handler(request):
+        if seen is not None:
+            seen.append(request)
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        return web.Response(status=status, body=payload)
+    
+    app = web.Application()
+    app.router.add_get(path, handler)
+    return app
+
+
+def stream_app(*frames):
+    """Serve /api/stream, check the API key, send frames, then close."""
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        auth = await ws.receive_json()
+        assert auth == {"apiKey": "qnrk_test"}
+        for frame in frames:
+            if isinstance(frame, bytes):
+                await ws.send_bytes(frame)
+            else:
+                await ws.send_str(frame)
+        await ws.close()
+        return ws
+    
+    app = web.Application()
+    app.router.add_get("/api/stream", handler)
+    return app
+
+
+class TestAsyncClient:
+    async def test_generate(self, serve):
+        seen = []
+        base_url = await serve(rest_app(seen=seen))
+        
+        async with AsyncQRNGClient("qnrk_test", base_url=base_url) as client:
+            result = await client.generate(bytes=2, method="photon")
+        
+        assert result.data == "00ff"
+        assert result.raw_bytes() == b"\x00\xff"
+        request = seen[0]
+        assert request.headers["X-API-Key"] == "qnrk_test"
+        assert request.query["bytes"] == "2"
+        assert request.query["method"] == "photon"
+    
+    @pytest.mark.parametrize("status,error", [
+        (401, AuthenticationError),
+        (402, QuotaExceededError),
+        (429, RateLimitError),
+    ])
+    async def test_status_errors(self, serve, status, error):
+        base_url = await serve(rest_app(status, {}))
+        async with AsyncQRNGClient("qnrk_test", base_url=base_url) as client:
+            with pytest.raises(error):
+                await client.generate()
+    
+    async def test_error_body(self, serve):
+        base_url = await serve(rest_app(400, {"error": "bytes out of range"}))
+        async with AsyncQRNGClient("qnrk_test", base_url=base_url) as client:
+            with pytest.raises(QRNGError) as info:
+                await client.generate(bytes=5000)
+        
+        assert str(info.value) == "bytes out of range"
+        assert info.value.status_code == 400
+    
+    async def test_non_json_error_body(self, serve):
+        base_url = await serve(rest_app(500, b"<html>oops</html>"))
+        async with AsyncQRNGClient("qnrk_test", base_url=base_url) as client:
+            with pytest.raises(QRNGError, match="HTTP 500"):
+                await client.generate()
+    
+    async def test_invalid_json(self, serve):
+        base_url = await serve(rest_app(200, b"<html>maintenance</html>"))
+        async with AsyncQRNGClient("qnrk_test", base_url=base_url) as client:
+            with pytest.raises(QRNGError, match="Request failed"):
+                await client.generate()
+    
+    async def test_health(self, serve):
+        body = {"status": "ok", "metrics": {}, "timestamp": "2024-01-01T00:00:00Z"}
+        base_url = await serve(rest_app(200, body, path="/api/health"))
+        async with AsyncQRNGClient("qnrk_test", base_url=base_url) as client:
+            assert (await client.health()).status == "ok"
+    
+    async def test_invalid_json_health(self, serve):
+        base_url = await serve(rest_app(200, b"<html>maintenance</html>", path="/api/health"))
+        async with AsyncQRNGClient("qnrk_test", base_url=base_url) as client:
+            with pytest.raises(QRNGError, match="Health check failed"):
+                await client.health()
+    
+    async def test_connection_error(self):
+        async with AsyncQRNGClient("qnrk_test", base_url="http://127.0.0.1:9") as client:
+            with pytest.raises(QRNGError, match="Request failed"):
+                await client.generate()
+    
+    async def test_passed_session_is_left_open(self, serve):
+        base_url = await serve(rest_app())
+        async with aiohttp.ClientSession() as session:
+            async with AsyncQRNGClient("qnrk_test", base_url=base_url, session=session) as client:
+                await client.generate()
+            assert not session.closed
+
+
+class TestAsyncStreamClient:
+    async def collect(self, base_url, **kwargs):
+        client = QRNGAsyncStreamClient("qnrk_test", base_url=base_url)
+        return [chunk async for chunk in client.stream(**kwargs)]
+    
+    async def test_text_and_binary_frames(self, serve):
+        base_url = await serve(stream_app(
+            json.dumps({"data": "00ff"}),
+            b"\x00\xff",
+            json.dumps({"data": "0101"}),
+        ))
+        
+        chunks = await self.collect(base_url.replace("http", "ws", 1))
+        assert chunks == ["00ff", b"\x00\xff", "0101"]
+    
+    async def test_error_message(self, serve):
+        base_url = await serve(stream_app(json.dumps({"error": "Invalid API key"})))
+        with pytest.raises(QRNGError, match="Invalid API key"):
+            await self.collect(base_url.replace("http", "ws", 1))
+    
+    async def test_malformed_message(self, serve):
+        base_url = await serve(stream_app("not json"))
+        with pytest.raises(QRNGError, match="Malformed stream message"):
+            await self.collect(base_url.replace("http", "ws", 1))
+    
+    async def test_connection_error(self):
+        with pytest.raises(QRNGError, match="Stream failed"):
+            await self.collect("ws://127.0.0.1:9")
@@ -0,0 +1,670 @@
+"""Tests for the REST client, using a fake session instead of the network."""
+
+import base64
+import dataclasses
+import io
+import json
+import pickle
+
+import pytest
+import requests
+from urllib3.exceptions import ProtocolError
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+import qrng.client
+from qrng import (
+    QRNGClient,
+    EntropyResult,
+    HealthStatus,
+    QRNGError,
+    AuthenticationError,
+    RateLimitError,
+    QuotaExceededError,
+)
+
+
+PAYLOAD = {
+    "data": "00ff",
+    "proofId": "proof-1",
+    "signature": "sig",
+    "publicKey": "key",
+    "signatureType": "ed25519",
+    "metadata": {"method": "simulator"},
+}
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=PAYLOAD, headers=None):
+        self.status_code = status_code
+        self.content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.raw = io.BytesIO(self.content)
+        self.closed = False
+    
+    def close(self):
+        self.closed = True
+    
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.closed = False
+    
+    def get(self, url, params=None, headers=None, timeout=None, stream=False):
+        self.calls.append({"url": url, "params": params, "headers": headers, "stream": stream})
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeAdapter(BaseAdapter):
+    """Serves queued FakeResponses through a real requests.Session."""
+    
+    def __init__(self, *responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.requests = []
+        self.sends = []
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        self.requests.append(request)
+        self.sends.append({"stream": stream, "timeout": timeout, "verify": verify})
+        fake = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = fake.status_code
+        response.headers = CaseInsensitiveDict(fake.headers)
+        response.raw = io.BytesIO(fake.content)
+        response.request = request
+        response.url = request.url
+        return response
+    
+    def close(self):
+        pass
+
+
+class FakeClock:
+    """Stands in for time.monotonic() and time.sleep()."""
+    
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(qrng.client.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(qrng.client.time, "sleep", clock.sleep)
+    monkeypatch.setattr(qrng.client.random, "uniform", lambda a, b: 0.0)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def empty_verify_cache():
+    EntropyResult._verify_cache.clear()
+    yield
+    EntropyResult._verify_cache.clear()
+
+
+def make_client(*responses, **kwargs):
+    session = FakeSession(*responses)
+    return QRNGClient("qnrk_test", session=session, **kwargs), session
+
+
+def make_adapter_client(*responses, **kwargs):
+    session = requests.Session()
+    adapter = FakeAdapter(*responses)
+    session.mount("https://", adapter)
+    return QRNGClient("qnrk_test", session=session, **kwargs), adapter
+
+
+def make_result(**overrides):
+    fields = {
+        "data": "00ff",
+        "proof_id": "proof-1",
+        "signature": "sig",
+        "public_key": "key",
+        "signature_type": "ed25519",
+        "metadata": {},
+    }
+    fields.update(overrides)
+    return EntropyResult(**fields)
+
+
+class TestRequest:
+    def test_default_call(self, clock):
+        client, session = make_client(FakeResponse())
+        result = client.generate()
+        
+        assert result.data == "00ff"
+        assert result.proof_id == "proof-1"
+        assert result.metadata == {"method": "simulator"}
+        assert session.calls[0]["url"] == "https://qrngapi.com/api/random"
+        assert session.calls[0]["params"] == {"bytes": 32, "format": "hex"}
+        assert session.calls[0]["headers"] == {"X-API-Key": "qnrk_test"}
+    
+    def test_optional_params(self, clock):
+        client, session = make_client(FakeResponse())
+        client.generate(bytes=16, format="uint8", method="photon", signature_type="dilithium2")
+        
+        assert session.calls[0]["params"] == {
+            "bytes": 16,
+            "format": "uint8",
+            "method": "photon",
+            "signatureType": "dilithium2",
+        }
+    
+    def test_default_params_are_not_shared_mutably(self, clock):
+        client, session = make_client(FakeResponse(), FakeResponse())
+        client.generate(bytes=16)
+        client.generate()
+        assert session.calls[1]["params"] == {"bytes": 32, "format": "hex"}
+
+
+class TestPreparedGenerator:
+    def test_url_and_headers(self, clock):
+        client, adapter = make_adapter_client(FakeResponse())
+        generate = client.prepare_generator(
+            format="base64", method="photon", signature_type="dilithium2"
+        )
+        
+        result = generate(64)
+        
+        request = adapter.requests[0]
+        assert request.method == "GET"
+        assert request.url == (
+            "https://qrngapi.com/api/random"
+            "?format=base64&method=photon&signatureType=dilithium2&bytes=64"
+        )
+        assert request.headers["X-API-Key"] == "qnrk_test"
+        assert adapter.sends[0]["timeout"] == 30
+        assert result.data == "00ff"
+    
+    def test_session_headers_are_merged(self, clock):
+        client, adapter = make_adapter_client(FakeResponse())
+        client.session.headers["User-Agent"] = "qrng-test"
+        
+        client.prepare_generator()(32)
+        
+        assert adapter.requests[0].headers["User-Agent"] == "qrng-test"
+        assert adapter.requests[0].headers["X-API-Key"] == "qnrk_test"
+    
+    def test_prepares_once_per_size(self, clock):
+        client, adapter = make_adapter_client(*[FakeResponse() for _ in range(3)])
+        generate = client.prepare_generator()
+        
+        generate(16)
+        generate(32)
+        generate(16)
+        
+        first, second, third = adapter.requests
+        assert first is third
+        assert second is not first
+        assert first.url.endswith("&bytes=16")
+        assert second.url.endswith("&bytes=32")
+    
+    def test_retry_resends_prepared_request(self, clock):
+        client, adapter = make_adapter_client(FakeResponse(503, {}), FakeResponse())
+        
+        assert client.prepare_generator()(32).data == "00ff"
+        assert len(adapter.requests) == 2
+        assert adapter.requests[0] is adapter.requests[1]
+        assert clock.sleeps == [0.5]
+    
+    def test_large_binary_is_streamed(self, clock):
+        body = dict(PAYLOAD, data=base64.b64encode(bytes(512)).decode())
+        response = FakeResponse(body=body)
+        response.headers["Content-Length"] = str(len(response.content))
+        client, adapter = make_adapter_client(response)
+        
+        assert client.prepare_generator(format="base64")(512).raw_bytes() == bytes(512)
+        assert adapter.sends[0]["stream"] is True
+    
+    def test_status_errors(self, clock):
+        client, _ = make_adapter_client(FakeResponse(401, {}))
+        with pytest.raises(AuthenticationError):
+            client.prepare_generator()(32)
+
+
+class TestStatus:
+    @pytest.mark.parametrize("status,error", [
+        (401, AuthenticationError),
+        (402, QuotaExceededError),
+    ])
+    def test_status_errors(self, clock, status, error):
+        client, _ = make_client(FakeResponse(status, {}))
+        with pytest.raises(error):
+            client.generate()
+    
+    def test_error_body(self, clock):
+        client, _ = make_client(FakeResponse(400, {"error": "bytes out of range"}))
+        with pytest.raises(QRNGError) as info:
+            client.generate(bytes=5000)
+        
+        assert str(info.value) == "bytes out of range"
+        assert info.value.status_code == 400
+        assert info.value.response == {"error": "bytes out of range"}
+    
+    @pytest.mark.parametrize("body", [b"<html>oops</html>", b"[1, 2]"])
+    def test_error_body_without_details(self, clock, body):
+        client, _ = make_client(FakeResponse(500, body))
+        with pytest.raises(QRNGError, match="HTTP 500"):
+            client.generate()
+    
+    def test_other_success_status(self, clock):
+        client, _ = make_client(FakeResponse(203))
+        assert client.generate().data == "00ff"
+    
+    def test_transport_error(self, clock):
+        client, _ = make_client(requests.ConnectionError("refused"))
+        with pytest.raises(QRNGError, match="Request failed"):
+            client.generate()
+
+
+class TestDecoding:
+    def test_invalid_json(self, clock):
+        client, _ = make_client(FakeResponse(body=b"<html>maintenance</html>"))
+        with pytest.raises(QRNGError, match="Request failed"):
+            client.generate()
+    
+    def test_invalid_json_streamed(self, clock):
+        response = FakeResponse(body=b"<html>maintenance</html>")
+        response.headers["Content-Length"] = str(len(response.content))
+        client, _ = make_client(response)
+        
+        with pytest.raises(QRNGError, match="Request failed"):
+            client.generate(bytes=512, format="base64")
+    
+    def test_invalid_json_prepared(self, clock):
+        client, _ = make_adapter_client(FakeResponse(body=b"<html>maintenance</html>"))
+        with pytest.raises(QRNGError, match="Request failed"):
+            client.prepare_generator()(32)
+    
+    def test_invalid_json_health(self):
+        client, _ = make_client(FakeResponse(body=b"<html>maintenance</html>"))
+        with pytest.raises(QRNGError, match="Health check failed"):
+            client.health()
+    
+    def test_health(self):
+        body = {"status": "ok", "metrics": {"nist": "pass"}, "timestamp": "2024-01-01T00:00:00Z"}
+        client, _ = make_client(FakeResponse(body=body))
+        
+        status = client.health()
+        assert status.status == "ok"
+        assert status.metrics == {"nist": "pass"}
+
+
+class TestRawBytes:
+    def test_generate_bytes(self, clock):
+        body = dict(PAYLOAD, data=base64.b64encode(b"\x01\x02\x03").decode())
+        client, session = make_client(FakeResponse(body=body))
+        
+        assert client.generate_bytes(3) == b"\x01\x02\x03"
+        assert session.calls[0]["params"]["format"] == "base64"
+    
+    def test_generate_uint32(self, clock):
+        numpy = pytest.importorskip("numpy")
+        raw = (1).to_bytes(4, "little") + (0xDEADBEEF).to_bytes(4, "little")
+        body = dict(PAYLOAD, data=base64.b64encode(raw).decode())
+        client, session = make_client(FakeResponse(body=body))
+        
+        values = client.generate_uint32(2)
+        assert values.dtype == numpy.uint32
+        assert values.tolist() == [1, 0xDEADBEEF]
+        assert session.calls[0]["params"]["bytes"] == 8
+        values[0] = 7
+    
+    @pytest.mark.parametrize("format,data,expected", [
+        ("hex", "00ff", b"\x00\xff"),
+        ("base64", "AP8=", b"\x00\xff"),
+        ("uint8", [0, 255], b"\x00\xff"),
+        ("uint32", [1], b"\x01\x00\x00\x00"),
+    ])
+    def test_raw_bytes(self, clock, format, data, expected):
+        client, _ = make_client(FakeResponse(body=dict(PAYLOAD, data=data)))
+        assert client.generate(format=format).raw_bytes() == expected
+    
+    def test_raw_bytes_survives_pickle(self, clock):
+        client, _ = make_client(FakeResponse())
+        result = pickle.loads(pickle.dumps(client.generate(format="hex")))
+        assert result.raw_bytes() == b"\x00\xff"
+    
+    def test_raw_bytes_unknown_format(self):
+        with pytest.raises(ValueError, match="format is unknown"):
+            make_result().raw_bytes()
+
+
+class TestStreamedBody:
+    def test_large_base64_is_streamed(self, clock):
+        body = dict(PAYLOAD, data=base64.b64encode(bytes(512)).decode())
+        response = FakeResponse(body=body)
+        response.headers["Content-Length"] = str(len(response.content))
+        client, session = make_client(response)
+        
+        result = client.generate(bytes=512, format="base64")
+        
+        assert session.calls[0]["stream"] is True
+        assert result.data == body["data"]
+        assert response.closed
+    
+    def test_small_and_hex_are_not_streamed(self, clock):
+        client, session = make_client(FakeResponse(), FakeResponse())
+        client.generate(bytes=256, format="base64")
+        client.generate(bytes=512, format="hex")
+        assert [call["stream"] for call in session.calls] == [False, False]
+    
+    def test_compressed_body_falls_back_to_content(self, clock):
+        response = FakeResponse(headers={"Content-Encoding": "gzip", "Content-Length": "10"})
+        response.raw = None
+        client, _ = make_client(response)
+        
+        assert client.generate(bytes=512, format="base64").data == "00ff"
+    
+    def test_truncated_body(self, clock):
+        response = FakeResponse()
+        response.headers["Content-Length"] = str(len(response.content) + 10)
+        client, _ = make_client(response)
+        
+        with pytest.raises(QRNGError, match="Incomplete response"):
+            client.generate(bytes=512, format="base64")
+    
+    def test_read_error(self, clock):
+        class BrokenRaw:
+            def readinto(self, buf):
+                raise ProtocolError("connection broken")
+        
+        response = FakeResponse(headers={"Content-Length": "100"})
+        response.raw = BrokenRaw()
+        client, _ = make_client(response)
+        
+        with pytest.raises(QRNGError, match="connection broken"):
+            client.generate(bytes=512, format="base64")
+        assert response.closed
+
+
+class TestBuffered:
+    block = bytes(range(256)) * 4
+    
+    @pytest.fixture
+    def buffered(self, clock):
+        body = dict(PAYLOAD, data=base64.b64encode(self.block).decode())
+        return make_client(*[FakeResponse(body=body) for _ in range(3)])
+    
+    def test_serves_slices_of_one_block(self, buffered):
+        client, session = buffered
+        assert client.generate_buffered(10) == self.block[:10]
+        assert client.generate_buffered(10) == self.block[10:20]
+        assert len(session.calls) == 1
+    
+    def test_refills_across_blocks(self, buffered):
+        client, session = buffered
+        client.generate_buffered(1000)
+        assert client.generate_buffered(48) == self.block[1000:] + self.block[:24]
+        assert len(session.calls) == 2
+    
+    def test_new_source_discards_buffer(self, buffered):
+        client, session = buffered
+        client.generate_buffered(10)
+        assert client.generate_buffered(10, method="photon") == self.block[:10]
+        assert session.calls[1]["params"]["method"] == "photon"
+    
+    def test_rejects_negative_size(self, buffered):
+        client, _ = buffered
+        client.generate_buffered(10)
+        with pytest.raises(ValueError):
+            client.generate_buffered(-5)
+    
+    def test_zero_bytes(self, buffered):
+        client, session = buffered
+        assert client.generate_buffered(0) == b""
+        assert session.calls == []
+
+
+class TestRetry:
+    def test_retries_503_with_backoff(self, clock):
+        client, session = make_client(
+            FakeResponse(503, {}),
+            FakeResponse(503, {}),
+            FakeResponse(),
+            retry_backoff=0.5,
+        )
+        
+        assert client.generate().data == "00ff"
+        assert clock.sleeps == [0.5, 1.0]
+        assert len(session.calls) == 3
+    
+    def test_honours_retry_after(self, clock):
+        client, _ = make_client(
+            FakeResponse(429, {}, headers={"Retry-After": "2"}),
+            FakeResponse(),
+        )
+        
+        client.generate()
+        assert clock.sleeps == [2.0]
+    
+    def test_gives_up_after_max_retries(self, clock):
+        client, session = make_client(
+            *[FakeResponse(429, {}) for _ in range(3)],
+            max_retries=2,
+        )
+        
+        with pytest.raises(RateLimitError):
+            client.generate()
+        assert len(session.calls) == 3
+        assert len(clock.sleeps) == 2
+    
+    def test_retry_after_over_cap_raises_at_once(self, clock):
+        client, session = make_client(
+            FakeResponse(429, {}, headers={"Retry-After": "3600"}),
+            FakeResponse(),
+            max_retry_wait=60,
+        )
+        
+        with pytest.raises(RateLimitError):
+            client.generate()
+        assert clock.sleeps == []
+        assert len(session.calls) == 1
+    
+    def test_does_not_retry_other_errors(self, clock):
+        client, session = make_client(FakeResponse(500, {}), FakeResponse())
+        
+        with pytest.raises(QRNGError):
+            client.generate()
+        assert len(session.calls) == 1
+    
+    def test_adapter_leaves_429_and_503_to_generate(self):
+        retries = qrng.client._build_adapter().max_retries
+        
+        assert 429 not in retries.status_forcelist
+        assert 503 not in retries.status_forcelist
+        assert not retries.respect_retry_after_header
+
+
+class TestRateLimit:
+    def test_rejects_non_positive_limit(self):
+        with pytest.raises(ValueError):
+            QRNGClient("qnrk_test", session=FakeSession(), rpm_limit=0)
+    
+    def test_throttles_after_burst(self, clock):
+        client, _ = make_client(rpm_limit=60)
+        
+        for _ in range(60):
+            client._acquire()
+        assert clock.sleeps == []
+        
+        client._acquire()
+        assert clock.sleeps == [pytest.approx(1.0)]
+    
+    def test_refills_over_time(self, clock):
+        client, _ = make_client(rpm_limit=60)
+        for _ in range(60):
+            client._acquire()
+        
+        clock.now += 30
+        for _ in range(30):
+            client._acquire()
+        assert clock.sleeps == []
+    
+    def test_429_lowers_limit(self, clock):
+        client, _ = make_client(
+            FakeResponse(429, {}, headers={"Retry-After": "1"}),
+            FakeResponse(),
+            rpm_limit=60,
+        )
+        
+        client.generate()
+        assert client._rpm_limit == 45
+        # The bucket was emptied, so the retry also waited for a fresh token
+        # at the lowered rate.
+        assert clock.sleeps == [1.0, pytest.approx(0.25 * 60 / 45)]
+    
+    def test_cuts_once_per_call(self, clock):
+        client, _ = make_client(
+            FakeResponse(429, {}, headers={"Retry-After": "1"}),
+            FakeResponse(429, {}, headers={"Retry-After": "1"}),
+            FakeResponse(),
+            rpm_limit=60,
+        )
+        
+        client.generate()
+        assert client._rpm_limit == 45
+    
+    def test_recovers_after_quiet_period(self, clock):
+        client, _ = make_client(rpm_limit=60)
+        for _ in range(3):
+            client._backoff_rate()
+        assert client._rpm_limit == 24
+        
+        clock.now += 60
+        client._acquire()
+        assert client._rpm_limit == 39
+        
+        clock.now += 59
+        client._acquire()
+        assert client._rpm_limit == 39
+        
+        clock.now += 1
+        client._acquire()
+        assert client._rpm_limit == 54
+        
+        clock.now += 60
+        client._acquire()
+        assert client._rpm_limit == 60
+
+
+class TestVerifyCache:
+    @pytest.fixture
+    def verify_calls(self, monkeypatch):
+        calls = []
+        
+        def fake_verify(result):
+            calls.append(result)
+            return True
+        
+        monkeypatch.setattr(EntropyResult, "_verify_signature", fake_verify)
+        return calls
+    
+    def test_enabled_reuses_outcome(self, verify_calls):
+        assert make_result().verify() is True
+        assert make_result().verify() is True
+        assert len(verify_calls) == 1
+    
+    def test_disabled_always_verifies(self, verify_calls):
+        make_result().verify()
+        make_result().verify(cache_policy="disabled")
+        assert len(verify_calls) == 2
+    
+    def test_replay_serves_cached_outcome(self, verify_calls):
+        make_result().verify()
+        assert make_result().verify(cache_policy="replay") is True
+        assert len(verify_calls) == 1
+    
+    def test_replay_raises_on_miss(self, verify_calls):
+        with pytest.raises(QRNGError):
+            make_result().verify(cache_policy="replay")
+        assert verify_calls == []
+    
+    def test_key_covers_signed_data(self, verify_calls):
+        make_result().verify()
+        make_result(data="ff00").verify()
+        make_result(signature_type="dilithium2").verify()
+        assert len(verify_calls) == 3
+    
+    def test_key_has_field_boundaries(self, verify_calls):
+        make_result(proof_id="ab", signature="c").verify()
+        make_result(proof_id="a", signature="bc").verify()
+        assert len(verify_calls) == 2
+    
+    def test_evicts_oldest(self, verify_calls, monkeypatch):
+        monkeypatch.setattr(qrng.client, "VERIFY_CACHE_MAXSIZE", 2)
+        for proof_id in ("a", "b", "c"):
+            make_result(proof_id=proof_id).verify()
+        
+        make_result(proof_id="c").verify()
+        assert len(verify_calls) == 3
+        make_result(proof_id="a").verify()
+        assert len(verify_calls) == 4
+
+
+class TestEntropyResult:
+    def test_digest_is_not_a_field(self):
+        result = make_result()
+        result.digest
+        
+        assert "_digest" not in dataclasses.asdict(result)
+        assert len(dataclasses.astuple(result)) == 6
+    
+    def test_frozen(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            make_result().data = "00"
+    
+    def test_slotted(self):
+        assert not hasattr(make_result(), "__dict__")
+        assert not hasattr(HealthStatus("ok", {}, "2024-01-01T00:00:00Z"), "__dict__")
+    
+    def test_equality(self):
+        assert make_result() == make_result()
+        assert make_result() != make_result(data="ff00")
+        assert hash(make_result()) == hash(make_result())
+    
+    def test_pickle(self):
+        result = make_result()
+        result.digest
+        
+        restored = pickle.loads(pickle.dumps(result))
+        assert restored == result
+        assert restored.digest == result.digest
+        assert not hasattr(restored, "__dict__")
+
+
+class TestSession:
+    def test_passed_session_is_left_open(self):
+        client, session = make_client()
+        client.close()
+        assert not session.closed
+    
+    def test_shared_session_is_left_open(self, monkeypatch):
+        shared = FakeSession()
+        monkeypatch.setattr(qrng.client, "_SHARED_SESSION", shared)
+        
+        client = QRNGClient("qnrk_test")
+        assert client.session is shared
+        client.close()
+        assert not shared.closed
@@ -0,0 +1,105 @@
+"""Tests for the HTTP/2 client, using httpx's mock transport."""
+
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+import qrng.client
+import qrng.httpx_client
+from qrng import QRNGError, RateLimitError
+from qrng.httpx_client import QRNGHttpxClient
+
+
+PAYLOAD = {
+    "data": "00ff",
+    "proofId": "proof-1",
+    "signature": "sig",
+    "publicKey": "key",
+    "signatureType": "ed25519",
+}
+
+
+def mock_session(*replies):
+    """An httpx.Client answering requests with queued (status, body, headers) replies."""
+    replies = list(replies)
+    seen = []
+    
+    def handler(request):
+        seen.append(request)
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        status, body, headers = reply
+        return httpx.Response(status, content=json.dumps(body).encode(), headers=headers)
+    
+    return httpx.Client(transport=httpx.MockTransport(handler)), seen
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(qrng.client.time, "sleep", lambda seconds: None)
+
+
+def test_generate():
+    session, seen = mock_session((200, PAYLOAD, {}))
+    client = QRNGHttpxClient("qnrk_test", base_url="https://example.test", session=session)
+    
+    result = client.generate(bytes=2, format="hex", method="photon")
+    
+    assert result.raw_bytes() == b"\x00\xff"
+    assert seen[0].url.path == "/api/random"
+    assert seen[0].url.params["bytes"] == "2"
+    assert seen[0].url.params["method"] == "photon"
+    assert seen[0].headers["X-API-Key"] == "qnrk_test"
+
+
+def test_prepare_generator():
+    session, seen = mock_session((200, PAYLOAD, {}), (200, PAYLOAD, {}))
+    client = QRNGHttpxClient("qnrk_test", base_url="https://example.test", session=session)
+    
+    generate = client.prepare_generator(format="base64")
+    generate(16)
+    generate(512)
+    
+    assert [r.url.params["bytes"] for r in seen] == ["16", "512"]
+    assert {r.url.params["format"] for r in seen} == {"base64"}
+
+
+def test_retries_then_raises():
+    session, seen = mock_session(*[(429, {}, {"Retry-After": "1"}) for _ in range(2)])
+    client = QRNGHttpxClient("qnrk_test", session=session, max_retries=1)
+    
+    with pytest.raises(RateLimitError):
+        client.generate()
+    assert len(seen) == 2
+
+
+def test_transport_error():
+    session, _ = mock_session(httpx.ConnectError("refused"))
+    client = QRNGHttpxClient("qnrk_test", session=session)
+    
+    with pytest.raises(QRNGError, match="Request failed"):
+        client.generate()
+
+
+def test_passed_session_is_left_open():
+    session, _ = mock_session()
+    QRNGHttpxClient("qnrk_test", session=session).close()
+    assert not session.is_closed
+
+
+def test_owned_session_is_closed():
+    client = QRNGHttpxClient("qnrk_test")
+    client.close()
+    assert client.session.is_closed
+
+
+def test_invalid_options_create_no_session(monkeypatch):
+    created = []
+    monkeypatch.setattr(qrng.httpx_client.httpx, "Client", lambda **kwargs: created.append(kwargs))
+    
+    with pytest.raises(ValueError):
+        QRNGHttpxClient("qnrk_test", rpm_limit=0)
+    assert created == []
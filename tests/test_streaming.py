@@ -0,0 +1,352 @@
+"""Tests for the streaming clients, using fake WebSockets."""
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+import websocket
+
+import qrng.streaming
+from qrng import QRNGStreamClient, QRNGStreamPool, QRNGError
+
+
+class FakeWebSocketApp:
+    """Records the callbacks QRNGStreamClient registers instead of connecting."""
+    
+    def __init__(self, url, **callbacks):
+        self.url = url
+        self.callbacks = callbacks
+        self.sent = []
+        self.run_options = None
+    
+    def run_forever(self, **options):
+        self.run_options = options
+    
+    def send(self, payload):
+        self.sent.append(payload)
+    
+    def close(self):
+        pass
+    
+    def deliver(self, opcode, message):
+        self.callbacks["on_data"](self, message, opcode, True)
+
+
+class TestStreamClient:
+    @pytest.fixture
+    def app(self, monkeypatch):
+        apps = []
+        
+        def create_app(url, **callbacks):
+            apps.append(FakeWebSocketApp(url, **callbacks))
+            return apps[-1]
+        
+        monkeypatch.setattr(qrng.streaming.websocket, "WebSocketApp", create_app)
+        self.data = []
+        self.errors = []
+        client = QRNGStreamClient("qnrk_test", base_url="wss://example.test")
+        client.connect(on_data=self.data.append, on_error=self.errors.append)
+        client.disconnect()
+        return apps[0]
+    
+    def test_skips_utf8_validation(self, app):
+        assert app.run_options["skip_utf8_validation"] is True
+        assert app.run_options["ping_interval"] == 20
+    
+    def test_authenticates_on_open(self, app):
+        app.callbacks["on_open"](app)
+        assert json.loads(app.sent[0]) == {"apiKey": "qnrk_test"}
+    
+    def test_text_frame_as_bytes(self, app):
+        app.deliver(websocket.ABNF.OPCODE_TEXT, b'{"data": "00ff"}')
+        assert self.data == ["00ff"]
+        assert self.errors == []
+    
+    def test_text_frame_error(self, app):
+        app.deliver(websocket.ABNF.OPCODE_TEXT, b'{"error": "Invalid API key"}')
+        assert self.data == []
+        assert isinstance(self.errors[0], QRNGError)
+        assert str(self.errors[0]) == "Invalid API key"
+    
+    def test_binary_frame(self, app):
+        # Binary payloads are passed through even if they look like JSON.
+        app.deliver(websocket.ABNF.OPCODE_BINARY, b'{"error": "x"}')
+        assert self.data == [b'{"error": "x"}']
+        assert self.errors == []
+    
+    def test_socket_error(self, app):
+        app.callbacks["on_error"](app, ConnectionResetError("reset"))
+        assert isinstance(self.errors[0], QRNGError)
+
+
+class FakeWebSocket:
+    """A WebSocket whose frames are queued by the test.
+    
+    Each queued frame writes one byte to a socketpair, so the pool's selector
+    sees the stream as readable exactly when a frame is waiting.
+    """
+    
+    def __init__(self):
+        self.sock, self._peer = socket.socketpair()
+        self.frames = []
+        self.sent = []
+        self.pings = 0
+        self.closed = False
+        self._lock = threading.Lock()
+    
+    def push(self, opcode, data):
+        with self._lock:
+            self.frames.append((opcode, data))
+        self._peer.send(b"x")
+    
+    def push_text(self, message):
+        self.push(websocket.ABNF.OPCODE_TEXT, json.dumps(message).encode())
+    
+    def recv_data(self, control_frame=False):
+        self.sock.recv(1)
+        with self._lock:
+            frame = self.frames.pop(0)
+        if isinstance(frame, Exception):
+            raise frame
+        return frame
+    
+    def fail_next(self, error):
+        with self._lock:
+            self.frames.append(error)
+        self._peer.send(b"x")
+    
+    def send(self, payload):
+        self.sent.append(payload)
+    
+    def fileno(self):
+        return self.sock.fileno()
+    
+    def ping(self):
+        self.pings += 1
+    
+    def close(self, timeout=None):
+        self.shutdown()
+    
+    def shutdown(self):
+        if not self.closed:
+            self.closed = True
+            self.sock.close()
+            self._peer.close()
+
+
+class Recorder:
+    """Collects callbacks from the pool thread and lets tests wait on them."""
+    
+    def __init__(self):
+        self.data = []
+        self.errors = []
+        self.closed = threading.Event()
+        self._changed = threading.Condition()
+    
+    def on_data(self, chunk):
+        with self._changed:
+            self.data.append(chunk)
+            self._changed.notify_all()
+    
+    def on_error(self, error):
+        with self._changed:
+            self.errors.append(error)
+            self._changed.notify_all()
+    
+    def on_close(self):
+        self.closed.set()
+    
+    def wait_for(self, predicate):
+        with self._changed:
+            assert self._changed.wait_for(predicate, timeout=5)
+    
+    def callbacks(self):
+        return {"on_data": self.on_data, "on_error": self.on_error, "on_close": self.on_close}
+
+
+def wait_until(predicate):
+    deadline = time.perf_counter() + 5
+    while not predicate():
+        assert time.perf_counter() < deadline
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def sockets(monkeypatch):
+    created = []
+    
+    def create_connection(url, **kwargs):
+        ws = FakeWebSocket()
+        ws.url = url
+        ws.options = kwargs
+        created.append(ws)
+        return ws
+    
+    monkeypatch.setattr(qrng.streaming.websocket, "create_connection", create_connection)
+    return created
+
+
+@pytest.fixture
+def pool(sockets):
+    pool = QRNGStreamPool("qnrk_test", base_url="wss://example.test")
+    yield pool
+    pool.close()
+
+
+def test_connect_authenticates_with_timeout(pool, sockets):
+    pool.connect(on_data=lambda chunk: None, chunk_size=64, format="base64")
+    
+    ws = sockets[0]
+    assert "chunkSize=64" in ws.url and "format=base64" in ws.url
+    assert ws.options["timeout"] == pool.timeout
+    assert json.loads(ws.sent[0]) == {"apiKey": "qnrk_test"}
+
+
+def test_connect_failure(monkeypatch):
+    def refuse(url, **kwargs):
+        raise ConnectionRefusedError("refused")
+    
+    monkeypatch.setattr(qrng.streaming.websocket, "create_connection", refuse)
+    with pytest.raises(QRNGError, match="Stream connection failed"):
+        QRNGStreamPool("qnrk_test").connect(on_data=lambda chunk: None)
+
+
+def test_dispatches_to_each_stream(pool, sockets):
+    a, b = Recorder(), Recorder()
+    pool.connect(**a.callbacks())
+    pool.connect(binary=True, **b.callbacks())
+    
+    sockets[0].push_text({"data": "00ff"})
+    sockets[1].push(websocket.ABNF.OPCODE_BINARY, b"\x00\xff")
+    sockets[0].push_text({"data": "0101"})
+    
+    a.wait_for(lambda: len(a.data) == 2)
+    b.wait_for(lambda: len(b.data) == 1)
+    assert a.data == ["00ff", "0101"]
+    assert b.data == [b"\x00\xff"]
+    # One thread serves every stream.
+    assert pool._thread is not None
+
+
+def test_server_error_message(pool, sockets):
+    recorder = Recorder()
+    pool.connect(**recorder.callbacks())
+    
+    sockets[0].push_text({"error": "Invalid API key"})
+    recorder.wait_for(lambda: recorder.errors)
+    assert str(recorder.errors[0]) == "Invalid API key"
+
+
+def test_server_close(pool, sockets):
+    recorder = Recorder()
+    stream_id = pool.connect(**recorder.callbacks())
+    
+    sockets[0].push(websocket.ABNF.OPCODE_CLOSE, b"")
+    assert recorder.closed.wait(5)
+    assert stream_id not in pool._streams
+    assert sockets[0].closed
+
+
+def test_broken_stream_does_not_affect_others(pool, sockets):
+    broken, healthy = Recorder(), Recorder()
+    broken_id = pool.connect(**broken.callbacks())
+    pool.connect(**healthy.callbacks())
+    
+    sockets[0].fail_next(websocket.WebSocketProtocolException("bad frame"))
+    assert broken.closed.wait(5)
+    assert isinstance(broken.errors[0], QRNGError)
+    assert broken_id not in pool._streams
+    
+    sockets[1].push_text({"data": "00ff"})
+    healthy.wait_for(lambda: healthy.data)
+
+
+def test_raising_data_callback_is_reported(pool, sockets):
+    recorder = Recorder()
+    
+    def on_data(chunk):
+        raise RuntimeError("callback bug")
+    
+    pool.connect(on_data=on_data, on_error=recorder.on_error)
+    sockets[0].push_text({"data": "00ff"})
+    
+    recorder.wait_for(lambda: recorder.errors)
+    assert "callback bug" in str(recorder.errors[0])
+
+
+def test_raising_error_callback_closes_only_its_stream(pool, sockets):
+    recorder = Recorder()
+    
+    def on_error(error):
+        raise RuntimeError("callback bug")
+    
+    broken_id = pool.connect(
+        on_data=recorder.on_data, on_error=on_error, on_close=recorder.on_close
+    )
+    pool.connect(on_data=recorder.on_data)
+    
+    sockets[0].push_text({"error": "Invalid API key"})
+    assert recorder.closed.wait(5)
+    assert broken_id not in pool._streams
+    
+    sockets[1].push_text({"data": "0101"})
+    recorder.wait_for(lambda: recorder.data == ["0101"])
+
+
+def test_malformed_json_is_reported(pool, sockets):
+    recorder = Recorder()
+    stream_id = pool.connect(**recorder.callbacks())
+    
+    sockets[0].push(websocket.ABNF.OPCODE_TEXT, b"not json")
+    recorder.wait_for(lambda: recorder.errors)
+    assert isinstance(recorder.errors[0], ValueError)
+    assert stream_id in pool._streams
+
+
+def test_read_timeout_keeps_stream(pool, sockets):
+    recorder = Recorder()
+    stream_id = pool.connect(**recorder.callbacks())
+    
+    sockets[0].fail_next(websocket.WebSocketTimeoutException("partial frame"))
+    sockets[0].push_text({"data": "00ff"})
+    
+    recorder.wait_for(lambda: recorder.data == ["00ff"])
+    assert recorder.errors == []
+    assert stream_id in pool._streams
+
+
+def test_disconnect(pool, sockets):
+    recorder = Recorder()
+    stream_id = pool.connect(**recorder.callbacks())
+    
+    pool.disconnect(stream_id)
+    assert recorder.closed.is_set()
+    assert sockets[0].closed
+    assert stream_id not in pool._streams
+
+
+def test_keepalive_pings_quiet_streams(pool, sockets, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(qrng.streaming.time, "monotonic", lambda: now[0])
+    recorder = Recorder()
+    stream_id = pool.connect(**recorder.callbacks())
+    stream = pool._streams[stream_id]
+    
+    now[0] += pool.ping_interval
+    pool._keepalive()
+    assert sockets[0].pings == 1
+    
+    # Any frame counts as an answer.
+    sockets[0].push(websocket.ABNF.OPCODE_PONG, b"")
+    wait_until(lambda: stream.ping_sent is None)
+    
+    now[0] += pool.ping_interval
+    pool._keepalive()
+    now[0] += pool.ping_timeout + 1
+    pool._keepalive()
+    
+    assert recorder.closed.wait(5)
+    assert "keepalive" in str(recorder.errors[0])
+    assert stream_id not in pool._streams